@@ -1,3 +1,5 @@
+from dataclasses import fields
+from functools import cache
 from importlib.metadata import distribution
 from typing import Callable
 
@@ -11,23 +13,65 @@ from model import (
     RepositoryMetaData,
     CategoryDistribution,
     LanguageDistribution,
+    LanguageWrapper,
+    RepositoryCategoryResult,
 )
 from utility import (
     ConfigurationService,
     FileService,
     LoggingService,
-    Utils,
 )
+from utility.report_sink_service import (
+    ColumnarReportWriter,
+    CsvReportWriter,
+    FileReportWriter,
+    JsonlReportWriter,
+    LatexReportWriter,
+    ReportSink,
+    ReportWriter,
+    SummaryReportWriter,
+)
+from utility.stage_cache_service import StageCacheService
 
 
 def evaluate_languages():
     LoggingService.info("🚀 Start 'evaluate_languages' ...")
 
-    repos = FileService.from_json(FileService.get_absolute_path(ConfigurationService.get_data_directory(), EnvConfig.organisation(), "repos-metadata.json"), RepositoryMetaData) # nur den einzelnen Typ mitgeben! keine Liste!
+    metadata_path = FileService.get_absolute_path(ConfigurationService.get_data_directory(), EnvConfig.organisation(), "repos-metadata.json")
+    metadata_fingerprint = StageCacheService.file_fingerprint(metadata_path)
+
+    @cache
+    def load_repos() -> list[RepositoryMetaData]:
+        # Metadaten nur laden, wenn mindestens ein Schritt neu berechnet werden muss
+        return FileService.from_json(metadata_path, RepositoryMetaData) # nur den einzelnen Typ mitgeben! keine Liste!
+
+    def result_path(file_name: str) -> str:
+        return FileService.get_absolute_path(ConfigurationService.get_result_directory(), EnvConfig.organisation(), file_name)
+
+    def columns(row_type: type) -> list[str]:
+        # Kopfzeile auch bei leeren Ergebnissen schreiben
+        return [field.name for field in fields(row_type)]
 
-    languages = EvaluationLanguageData.collect_all_languages(repos)
+    def file_writers(key: str, *writers: FileReportWriter) -> list[FileReportWriter]:
+        # Nur Dateien schreiben, die nicht bereits aus demselben Schritt-Schlüssel stammen
+        return [writer for writer in writers if not StageCacheService.is_output_current(writer.path, key)]
 
-    language_distributions = EvaluationLanguageData.evaluate_global_language_distribution(repos)
+    def write_report(rows: list, key: str, writers: list[FileReportWriter], console_writers: list[ReportWriter]):
+        ReportSink(writers + console_writers).consume(rows)
+        for writer in writers:
+            StageCacheService.mark_output(writer.path, key)
+
+    languages, languages_key = StageCacheService.run_stage(
+        "languages",
+        {"metadata": metadata_fingerprint},
+        lambda: EvaluationLanguageData.collect_all_languages(load_repos()),
+    )
+
+    language_distributions, language_distributions_key = StageCacheService.run_stage(
+        "language-distribution",
+        {"metadata": metadata_fingerprint},
+        lambda: EvaluationLanguageData.evaluate_global_language_distribution(load_repos()),
+    )
 
     config = RepositoryCategoryConfig(
         threshold_percent=7,
@@ -37,49 +81,39 @@ def evaluate_languages():
             "Python": {"Python", "Jupyter Notebook"}
         }
     )
-    repository_distribution, category_distribution = EvaluationLanguageData.evaluate_repository_category_distribution(repos, config, precision=1)
-
-    LoggingService.info("📈 Languages:")
-    FileService.to_csv(languages, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "languages.csv")
-    LoggingService.log_list(languages)
-
-    LoggingService.info("📈 Global language distribution:")
-    FileService.to_csv(language_distributions, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "language-distribution.csv")
-    LoggingService.log_list(language_distributions)
-
-    LoggingService.info("📈 Repository category distribution:")
-    FileService.to_csv(repository_distribution, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "repository-distribution.csv")
-    FileService.to_csv(category_distribution, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "category-distribution.csv")
-    LoggingService.log_list(repository_distribution)
-    LoggingService.log_list(category_distribution)
-
-    def category_value_fn(x: CategoryDistribution) -> float:
-        return x.normalized_percentage
-    def category_label_fn(x: CategoryDistribution) -> str:
-        return x.category
-
-    formated_category_distribution = Utils.format_latex_distribution(
-        data=category_distribution,
-        value_fn=category_value_fn,
-        label_fn=category_label_fn,
-    )
-    LoggingService.info(f"category_distribution: {formated_category_distribution}")
-
-    def language_value_fn(x: LanguageDistribution) -> float:
-        return x.percentage
-
-    def language_label_fn(x: LanguageDistribution) -> str:
-        return x.language
-
-    formated_language_distribution = Utils.format_latex_distribution_with_remainder(
-        data=language_distributions,
-        value_fn=language_value_fn,
-        label_fn=language_label_fn,
-        threshold=2.13
+    precision = 1
+    (repository_distribution, category_distribution), categories_key = StageCacheService.run_stage(
+        "category-distribution",
+        {"metadata": metadata_fingerprint, "config": config, "precision": precision},
+        lambda: EvaluationLanguageData.evaluate_repository_category_distribution(load_repos(), config, precision=precision),
     )
 
-    LoggingService.info(f"language_distribution: {formated_language_distribution}")
-
+    write_report(languages, languages_key, file_writers(
+        languages_key,
+        CsvReportWriter(result_path("languages.csv"), columns(LanguageWrapper)),
+    ), [SummaryReportWriter("Languages", top_n=20)])
+
+    language_latex = LatexReportWriter(value_key="percentage", label_key="language", threshold=2.13)
+    write_report(language_distributions, language_distributions_key, file_writers(
+        language_distributions_key,
+        CsvReportWriter(result_path("language-distribution.csv"), columns(LanguageDistribution)),
+    ), [language_latex, SummaryReportWriter("Global language distribution", value_key="percentage")])
+
+    write_report(repository_distribution, categories_key, file_writers(
+        categories_key,
+        CsvReportWriter(result_path("repository-distribution.csv"), columns(RepositoryCategoryResult)),
+        JsonlReportWriter(result_path("repository-distribution.jsonl")),
+        ColumnarReportWriter(result_path("repository-distribution.columnar.jsonl")),
+    ), [SummaryReportWriter("Repository category distribution")])
+
+    category_latex = LatexReportWriter(value_key="normalized_percentage", label_key="category")
+    write_report(category_distribution, categories_key, file_writers(
+        categories_key,
+        CsvReportWriter(result_path("category-distribution.csv"), columns(CategoryDistribution)),
+    ), [category_latex, SummaryReportWriter("Category distribution", value_key="count")])
+
+    LoggingService.info(f"category_distribution: {category_latex.result}")
+    LoggingService.info(f"language_distribution: {language_latex.result}")
 
     return
 
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+from dataclasses import replace
+
+from git import Actor, Repo
+
+from model import EnvConfig, RepositoryMetaData
+from utility import (
+    ConfigurationService,
+    FileService,
+    LoggingService,
+    Utils,
+)
+from utility.git_service import GitService
+from utility.object_store_service import ObjectStoreService
+
+FORK_COUNT = 4
+COMMIT_COUNT = 20
+FILE_SIZE = 64 * 1024
+FAMILY_OWNER = "local-fork-family"
+
+
+def _commit_random_files(repo: Repo, prefix: str, count: int):
+    author = Actor("evaluation", "evaluation@localhost")
+    for i in range(count):
+        file_name = os.path.join(repo.working_tree_dir, f"{prefix}-{i}.txt")
+        with open(file_name, "w", encoding="utf-8") as f:
+            f.write(os.urandom(FILE_SIZE).hex())
+        repo.index.add([file_name])
+        repo.index.commit(f"{prefix} {i}", author=author, committer=author)
+
+
+def _generate_fork_family(root: str) -> list[RepositoryMetaData]:
+    """Erzeugt ein Upstream-Repository und mehrere Forks mit jeweils eigenen Commits."""
+    upstream = Repo.init(os.path.join(root, "upstream"))
+    _commit_random_files(upstream, "upstream", COMMIT_COUNT)
+    upstream_url = f"file://{upstream.working_tree_dir}"
+
+    members = [
+        RepositoryMetaData(
+            repository_name="upstream",
+            repository_owner=FAMILY_OWNER,
+            repository_id=0,
+            repository_http_url=upstream_url,
+            repository_size=0,
+        )
+    ]
+    for n in range(FORK_COUNT):
+        fork = Repo.clone_from(upstream_url, os.path.join(root, f"fork-{n}"))
+        _commit_random_files(fork, f"fork-{n}", 2)
+        members.append(
+            RepositoryMetaData(
+                repository_name=f"fork-{n}",
+                repository_owner=FAMILY_OWNER,
+                repository_id=n + 1,
+                repository_http_url=f"file://{fork.working_tree_dir}",
+                repository_size=0,
+                is_fork=True,
+                network_root=f"{FAMILY_OWNER}/upstream",
+            )
+        )
+
+    return members
+
+
+def _all_intact(paths: list[str]) -> bool:
+    # Ohne Kurzschluss, damit jeder defekte Klon protokolliert wird
+    results = [ObjectStoreService.verify(path) for path in paths]
+    return all(results)
+
+
+def evaluate_object_store_savings():
+    LoggingService.info("🚀 Start 'evaluate_object_store_savings' ...")
+
+    with tempfile.TemporaryDirectory() as root:
+        members = _generate_fork_family(os.path.join(root, "remote"))
+        network_key = ObjectStoreService.network_key(members[0])
+        member_paths = [
+            FileService.get_absolute_path(ConfigurationService.get_repository_path_builder(repo))
+            for repo in members
+        ]
+
+        # Gleicher Ablauf wie in der Produktion: gemeinsamer Speicher + Klone mit --reference
+        shared_transfer = GitService.clone_network(members)
+        cloned_paths = [path for path in member_paths if os.path.isdir(path)]
+        savings = ObjectStoreService.measure_savings(
+            network_key, ObjectStoreService.store_path(network_key), cloned_paths, shared_transfer
+        )
+
+        independent_disk = 0
+        for repo in members:
+            path = os.path.join(root, "independent", repo.repository_name)
+            Repo.clone_from(repo.repository_http_url, path)
+            independent_disk += Utils.directory_size(path)
+        LoggingService.info(
+            f"📏 Platzbedarf unabhängiger Klone: gemessen {independent_disk} Bytes, "
+            f"geschätzt {savings.independent_disk_bytes} Bytes"
+        )
+        savings = replace(savings, independent_disk_bytes=independent_disk)
+
+        # Upstream-Klon entfernen – die Forks referenzieren nur den Speicher und müssen intakt bleiben
+        shutil.rmtree(member_paths[0])
+        forks_intact = _all_intact(member_paths[1:])
+        LoggingService.info(f"🔒 Forks nach Entfernen des Upstream-Klons intakt: {forks_intact}")
+
+        # Speicher entfernen (Repack + fsck aller Mitglieder) – danach muss jeder Fork eigenständig sein
+        removed = ObjectStoreService.remove_network_store(network_key, members)
+        store_intact = removed and _all_intact(member_paths[1:])
+        LoggingService.info(f"🔒 Forks nach Entfernen des Objektspeichers intakt: {store_intact}")
+
+        for path in member_paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+    LoggingService.info(
+        f"💾 {network_key}: Platte {savings.saved_disk_bytes()} Bytes, "
+        f"Übertragung {savings.saved_transfer_bytes()} Bytes eingespart."
+    )
+    FileService.to_csv([savings], ConfigurationService.get_result_directory(), EnvConfig.organisation(), "object-store-savings.csv")
+    LoggingService.log_list([savings])
+
+
+if __name__ == "__main__":
+    ConfigurationService.load_environment_configuration()
+    evaluate_object_store_savings()
@@ -0,0 +1,51 @@
+from evaluation import EvaluationLanguageHistory
+from model import (
+    EnvConfig,
+    RepositoryCategoryConfig,
+    RepositoryMetaData,
+    WorkspaceConfig,
+)
+from utility import (
+    ConfigurationService,
+    FileService,
+    LoggingService,
+)
+from utility.workspace_service import WorkspaceService
+
+
+def evaluate_language_history():
+    LoggingService.info("🚀 Start 'evaluate_language_history' ...")
+
+    repos = FileService.from_json(FileService.get_absolute_path(ConfigurationService.get_data_directory(), EnvConfig.organisation(), "repos-metadata.json"), RepositoryMetaData)
+
+    config = RepositoryCategoryConfig(
+        threshold_percent=7,
+        categories={
+            "Frontend": {"Vue", "JavaScript", "TypeScript", "HTML", "CSS"},
+            "Backend": {"Java"},
+            "Python": {"Python", "Jupyter Notebook"}
+        }
+    )
+    periods = EvaluationLanguageHistory.build_periods(years=5, months_per_period=3)
+
+    # Klonen, Historie lesen und Verdrängen als Pipeline – nie mehr als das Budget auf der Platte
+    WorkspaceService.configure(WorkspaceConfig(budget_bytes=20 * 1024 ** 3, collapse_on_evict=True))
+    histories = WorkspaceService.process_rolling(
+        repos, lambda repo, path: EvaluationLanguageHistory.analyze_repository(path, periods)
+    )
+    language_history, category_history = EvaluationLanguageHistory.aggregate_history(
+        repos, histories, periods, config, precision=1
+    )
+
+    LoggingService.info("📈 Language distribution history:")
+    FileService.to_csv(language_history, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "language-history.csv")
+    LoggingService.log_list(language_history)
+
+    LoggingService.info("📈 Category distribution history:")
+    FileService.to_csv(category_history, ConfigurationService.get_result_directory(), EnvConfig.organisation(), "category-history.csv")
+    LoggingService.log_list(category_history)
+
+
+if __name__ == "__main__":
+    ConfigurationService.load_environment_configuration()
+    evaluate_language_history()
@@ -1,8 +1,10 @@
 from typing import List
 
 from .evaluation_language_data import EvaluationLanguageData
+from .evaluation_language_history import EvaluationLanguageHistory
 
 __all__: List[str] = [
   #"CalculationService",
-    "EvaluationLanguageData"
+    "EvaluationLanguageData",
+    "EvaluationLanguageHistory",
 ]
@@ -44,9 +44,10 @@ class EvaluationLanguageData:
 
     @classmethod
     def evaluate_global_language_distribution(
-        cls, repository_metadata: list[RepositoryMetaData]
+        cls, repository_metadata: list[RepositoryMetaData], quiet: bool = False
     ) -> list[LanguageDistribution]:
-        LoggingService.info("📊 Starting global language distribution evaluation ...")
+        if not quiet:
+            LoggingService.info("📊 Starting global language distribution evaluation ...")
 
         language_totals = defaultdict(int)
         total_bytes = 0
@@ -54,12 +55,14 @@ class EvaluationLanguageData:
 
         for i, repo in enumerate(repository_metadata, 1):
             repo_name = repo.repository_name
-            LoggingService.info(
-                f"🔍 ({i}/{repo_count}) Evaluating linguistic data of '{repo_name}'"
-            )
+            if not quiet:
+                LoggingService.info(
+                    f"🔍 ({i}/{repo_count}) Evaluating linguistic data of '{repo_name}'"
+                )
 
             if not repo.linguistic_data:
-                LoggingService.info(f"⚠️ No linguistic data available for '{repo_name}'")
+                if not quiet:
+                    LoggingService.info(f"⚠️ No linguistic data available for '{repo_name}'")
                 continue
 
             try:
@@ -76,7 +79,8 @@ class EvaluationLanguageData:
             LoggingService.info("⚠️ No language data found across repositories.")
             return []
 
-        LoggingService.info("✅ Language data successfully aggregated.")
+        if not quiet:
+            LoggingService.info("✅ Language data successfully aggregated.")
 
         result = []
         for language, byte_count in sorted(
@@ -97,6 +101,7 @@ class EvaluationLanguageData:
         repository_metadata: list[RepositoryMetaData],
         config: RepositoryCategoryConfig,
         precision: int = 2,  # <--- NEU
+        quiet: bool = False,
     ) -> tuple[list[RepositoryCategoryResult], list[CategoryDistribution]]:
         repo_count = len(repository_metadata)
         repo_category_map: dict[str, str] = {}
@@ -104,12 +109,14 @@ class EvaluationLanguageData:
 
         for i, repo in enumerate(repository_metadata, 1):
             repo_name = repo.repository_name
-            LoggingService.info(
-                f"🔍 ({i}/{repo_count}) Analyzing repository '{repo_name}'"
-            )
+            if not quiet:
+                LoggingService.info(
+                    f"🔍 ({i}/{repo_count}) Analyzing repository '{repo_name}'"
+                )
 
             if not repo.linguistic_data:
-                LoggingService.info(f"⚠️ No linguistic data available for '{repo_name}'")
+                if not quiet:
+                    LoggingService.info(f"⚠️ No linguistic data available for '{repo_name}'")
                 repo_category_map[repo_name] = "Rest"
                 category_counter["Rest"] += 1
                 continue
@@ -186,5 +193,6 @@ class EvaluationLanguageData:
                 )
             )
 
-        LoggingService.info("✅ Language data successfully aggregated.")
+        if not quiet:
+            LoggingService.info("✅ Language data successfully aggregated.")
         return repo_results, category_results
@@ -0,0 +1,296 @@
+import os
+import subprocess
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional
+
+from model import (
+    CategoryHistoryEntry,
+    LanguageHistoryEntry,
+    RepositoryCategoryConfig,
+    RepositoryMetaData,
+    WorkspaceEntry,
+)
+from utility import ConfigurationService, FileService, LoggingService
+from utility.git_object_reader import GitObjectReader
+from utility.threading_service import use_threads
+
+from .evaluation_language_data import EvaluationLanguageData
+
+# Subset of the GitHub linguist extension mapping (programming and markup languages only)
+LANGUAGE_EXTENSIONS: dict[str, str] = {
+    ".py": "Python",
+    ".ipynb": "Jupyter Notebook",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".kts": "Kotlin",
+    ".groovy": "Groovy",
+    ".gradle": "Groovy",
+    ".scala": "Scala",
+    ".js": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".vue": "Vue",
+    ".html": "HTML",
+    ".htm": "HTML",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".less": "Less",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".ps1": "PowerShell",
+    ".bat": "Batchfile",
+    ".cmd": "Batchfile",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".c": "C",
+    ".h": "C",
+    ".cpp": "C++",
+    ".cc": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".php": "PHP",
+    ".rb": "Ruby",
+    ".swift": "Swift",
+    ".tf": "HCL",
+    ".hcl": "HCL",
+    ".tex": "TeX",
+    ".ftl": "FreeMarker",
+    ".mustache": "Mustache",
+}
+
+LANGUAGE_FILENAMES: dict[str, str] = {
+    "Dockerfile": "Dockerfile",
+    "Makefile": "Makefile",
+}
+
+VENDORED_DIRECTORIES = {"node_modules", "vendor", "dist", ".git"}
+
+TREE_MODE = "40000"
+BLOB_MODES = {"100644", "100755"}
+
+
+class EvaluationLanguageHistory:
+    @staticmethod
+    def build_periods(years: int, months_per_period: int = 3) -> list[tuple[str, float]]:
+        """
+        Builds the sampling periods of the last `years` years, oldest first.
+
+        :return: List of (label, exclusive end timestamp) tuples.
+        """
+        now = datetime.now()
+        month_index = now.year * 12 + (now.month - 1) // months_per_period * months_per_period
+        periods = []
+
+        for _ in range(years * 12 // months_per_period):
+            year, month = divmod(month_index, 12)
+            if months_per_period == 3:
+                label = f"{year}-Q{month // 3 + 1}"
+            else:
+                label = f"{year}-{month + 1:02d}"
+
+            end_year, end_month = divmod(month_index + months_per_period, 12)
+            end = datetime(end_year, end_month + 1, 1).timestamp()
+            periods.append((label, min(end, now.timestamp())))
+            month_index -= months_per_period
+
+        return list(reversed(periods))
+
+    @staticmethod
+    def _sample_trees(repo_path: str, periods: list[tuple[str, float]]) -> dict[str, str]:
+        """Maps each period to the root tree of the last first-parent commit before its end."""
+        shallow = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "--is-shallow-repository"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        if shallow == "true":
+            LoggingService.info(
+                f"⚠️ '{repo_path}' is a shallow clone – older periods may be missing."
+            )
+
+        log = subprocess.run(
+            ["git", "-C", repo_path, "log", "--first-parent", "--format=%T %ct", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+
+        commits = sorted(
+            ((int(log[i + 1]), log[i]) for i in range(0, len(log), 2)), reverse=True
+        )
+
+        samples = {}
+        position = 0
+        for label, end in reversed(periods):
+            while position < len(commits) and commits[position][0] >= end:
+                position += 1
+            if position == len(commits):
+                break
+            samples[label] = commits[position][1]
+
+        return samples
+
+    @classmethod
+    def analyze_repository(
+        cls, repo_path: str, periods: list[tuple[str, float]]
+    ) -> dict[str, dict[str, int]]:
+        """
+        Computes the language bytes of a repository for every period.
+
+        Language totals are memoized per tree SHA and blob sizes per blob SHA,
+        so subtrees that did not change between samples are read only once.
+        """
+        tree_cache: dict[str, dict[str, int]] = {}
+        blob_sizes: dict[str, int] = {}
+
+        with GitObjectReader(repo_path) as reader:
+
+            def tree_languages(tree_sha: str) -> dict[str, int]:
+                cached = tree_cache.get(tree_sha)
+                if cached is not None:
+                    return cached
+
+                totals: dict[str, int] = defaultdict(int)
+                blobs: list[tuple[str, str]] = []
+
+                for mode, name, sha in reader.read_tree(tree_sha):
+                    if mode == TREE_MODE:
+                        if name not in VENDORED_DIRECTORIES:
+                            for language, byte_count in tree_languages(sha).items():
+                                totals[language] += byte_count
+                    elif mode in BLOB_MODES:
+                        language = LANGUAGE_FILENAMES.get(name) or LANGUAGE_EXTENSIONS.get(
+                            os.path.splitext(name)[1].lower()
+                        )
+                        if language:
+                            blobs.append((language, sha))
+
+                unknown = {sha for _, sha in blobs if sha not in blob_sizes}
+                if unknown:
+                    blob_sizes.update(reader.object_sizes(unknown))
+
+                for language, sha in blobs:
+                    totals[language] += blob_sizes.get(sha, 0)
+
+                tree_cache[tree_sha] = dict(totals)
+                return tree_cache[tree_sha]
+
+            samples = cls._sample_trees(repo_path, periods)
+            return {label: tree_languages(tree_sha) for label, tree_sha in samples.items()}
+
+    @classmethod
+    def evaluate_language_history(
+        cls,
+        repository_metadata: list[RepositoryMetaData],
+        config: RepositoryCategoryConfig,
+        years: int = 5,
+        months_per_period: int = 3,
+        precision: int = 2,
+        max_threads: int = 4,
+    ) -> tuple[list[LanguageHistoryEntry], list[CategoryHistoryEntry]]:
+        LoggingService.info(
+            f"🕰️ Starting language history evaluation for the last {years} years ..."
+        )
+
+        periods = cls.build_periods(years, months_per_period)
+        cloned: list[RepositoryMetaData] = []
+        repo_paths: list[str] = []
+        for repo in repository_metadata:
+            repo_path = FileService.get_absolute_path(
+                ConfigurationService.get_repository_path_builder(repo)
+            )
+            # Collapsed clones (WorkspaceService) keep their full history as bare repository
+            collapsed_path = f"{repo_path}{WorkspaceEntry.COLLAPSED_SUFFIX}"
+            if FileService.has_repository(repo):
+                repo_paths.append(repo_path)
+            elif os.path.isdir(collapsed_path):
+                repo_paths.append(collapsed_path)
+            else:
+                LoggingService.info(
+                    f"⚠️ '{repo.repository_name}' is not cloned locally – skipped."
+                )
+                continue
+            cloned.append(repo)
+
+        LoggingService.info(
+            f"🔍 {len(cloned)}/{len(repository_metadata)} repositories are available locally."
+        )
+
+        def analyze(item: tuple[RepositoryMetaData, str]) -> dict[str, dict[str, int]]:
+            repo, repo_path = item
+            try:
+                return cls.analyze_repository(repo_path, periods)
+            except Exception as e:
+                LoggingService.error(
+                    f"❌ Failed to read history of '{repo.repository_name}': {e}"
+                )
+                return {}
+
+        histories = use_threads(
+            analyze, list(zip(cloned, repo_paths, strict=True)), max_threads=max_threads, description="🕰️ Reading history"
+        )
+
+        return cls.aggregate_history(cloned, histories, periods, config, precision=precision)
+
+    @staticmethod
+    def aggregate_history(
+        repository_metadata: list[RepositoryMetaData],
+        histories: list[Optional[dict[str, dict[str, int]]]],
+        periods: list[tuple[str, float]],
+        config: RepositoryCategoryConfig,
+        precision: int = 2,
+    ) -> tuple[list[LanguageHistoryEntry], list[CategoryHistoryEntry]]:
+        """
+        Aggregates per-repository histories (see `analyze_repository`) into
+        language and category distributions per period.
+
+        :param histories: One history per repository, None or empty if it could not be read.
+        """
+        language_history: list[LanguageHistoryEntry] = []
+        category_history: list[CategoryHistoryEntry] = []
+
+        for label, _ in periods:
+            snapshot = [
+                replace(repo, linguistic_data=history[label])
+                for repo, history in zip(repository_metadata, histories, strict=True)
+                if history and label in history
+            ]
+            if not snapshot:
+                continue
+
+            LoggingService.info(f"📅 Period {label}: {len(snapshot)} repositories")
+
+            # quiet: only the period line above instead of one line per repository and period
+            for entry in EvaluationLanguageData.evaluate_global_language_distribution(
+                snapshot, quiet=True
+            ):
+                language_history.append(
+                    LanguageHistoryEntry(
+                        period=label,
+                        language=entry.language,
+                        bytes=entry.bytes,
+                        percentage=entry.percentage,
+                    )
+                )
+
+            _, category_distribution = EvaluationLanguageData.evaluate_repository_category_distribution(
+                snapshot, config, precision=precision, quiet=True
+            )
+            for entry in category_distribution:
+                category_history.append(
+                    CategoryHistoryEntry(
+                        period=label,
+                        category=entry.category,
+                        count=entry.count,
+                        percentage=entry.percentage,
+                        normalized_percentage=entry.normalized_percentage,
+                    )
+                )
+
+        LoggingService.info("✅ Language history successfully aggregated.")
+        return language_history, category_history
@@ -3,12 +3,15 @@ from typing import List
 from .configType import EnvConfig
 from .evaluation_types import (
     CategoryDistribution,
+    CategoryHistoryEntry,
     LanguageDistribution,
+    LanguageHistoryEntry,
     LanguageWrapper,
     RepositoryCategoryResult,
 )
 from .filter_types import RepositoryCategoryConfig, RepositoryFilterOptions
 from .repository_meta_data import LinguisticData, RepositoryMetaData
+from .workspace_types import ObjectStoreSavings, WorkspaceConfig, WorkspaceEntry
 
 __all__: List[str] = [
     "EnvConfig",
@@ -16,8 +19,13 @@ __all__: List[str] = [
     "LinguisticData",
     "RepositoryCategoryResult",
     "CategoryDistribution",
+    "CategoryHistoryEntry",
     "LanguageDistribution",
+    "LanguageHistoryEntry",
+    "ObjectStoreSavings",
     "RepositoryFilterOptions",
     "RepositoryCategoryConfig",
     "RepositoryMetaData",
+    "WorkspaceConfig",
+    "WorkspaceEntry",
 ]
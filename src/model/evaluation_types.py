@@ -33,4 +33,25 @@ class LanguageWrapper:
     language: str
 
     def to_dict(self) -> dict:
-        return asdict(self)
\ No newline at end of file
+        return asdict(self)
+
+@dataclass
+class LanguageHistoryEntry:
+    period: str
+    language: str
+    bytes: int
+    percentage: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+@dataclass
+class CategoryHistoryEntry:
+    period: str
+    category: str
+    count: int
+    percentage: float
+    normalized_percentage: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
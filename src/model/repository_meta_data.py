@@ -26,6 +26,8 @@ class RepositoryMetaData:
     repository_http_url: str
     repository_size: int
     linguistic_data: Dict[str, int] = field(default_factory=dict)
+    is_fork: bool = False
+    network_root: Optional[str] = None  # "owner/name" des Ursprungs-Repositories im Fork-Netzwerk
 
     def __str__(self):
         return f'{self.repository_name} {self.repository_http_url} {self.repository_size}'
@@ -0,0 +1,43 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class WorkspaceConfig:
+    budget_bytes: int = 20 * 1024 ** 3
+    size_factor: float = 2.0  # Arbeitskopie + .git gegenüber der GitHub-Größe
+    collapse_on_evict: bool = False
+    clone_threads: int = 2
+    analyze_threads: int = 4
+
+
+@dataclass
+class WorkspaceEntry:
+    COLLAPSED_SUFFIX = ".bare"  # Pfad-Suffix reduzierter Klone (Bare-Repository ohne Arbeitskopie)
+
+    repository_key: str
+    path: str
+    size_bytes: int
+    last_access: float
+    collapsed: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class ObjectStoreSavings:
+    network: str
+    members: int
+    independent_disk_bytes: int
+    shared_disk_bytes: int
+    independent_transfer_bytes: int
+    shared_transfer_bytes: int
+
+    def saved_disk_bytes(self) -> int:
+        return self.independent_disk_bytes - self.shared_disk_bytes
+
+    def saved_transfer_bytes(self) -> int:
+        return self.independent_transfer_bytes - self.shared_transfer_bytes
+
+    def to_dict(self) -> dict:
+        return asdict(self)
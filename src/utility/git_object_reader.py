@@ -0,0 +1,83 @@
+import subprocess
+from typing import Iterable
+
+
+class GitObjectReader:
+    """
+    Liest Git-Objekte über dauerhaft geöffnete `git cat-file`-Pipes, ohne Checkout.
+
+    `--batch` liefert Tree-Inhalte, `--batch-check` die Größen von Blobs.
+    Verwendung als Context-Manager, damit die Prozesse beendet werden.
+    """
+
+    CHUNK_SIZE = 512  # begrenzt ungelesene Ausgaben, damit die Pipe nicht blockiert
+
+    def __init__(self, repo_path: str):
+        self._batch = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._batch_check = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def read_tree(self, sha: str) -> list[tuple[str, str, str]]:
+        """
+        Liest die Einträge eines Trees.
+
+        :return: Liste von (Modus, Name, SHA)-Tupeln.
+        """
+        self._batch.stdin.write(f"{sha}\n".encode())
+        self._batch.stdin.flush()
+
+        header = self._batch.stdout.readline().split()
+        if len(header) < 3 or header[1] != b"tree":
+            raise KeyError(f"Kein Tree-Objekt: {sha}")
+
+        data = self._batch.stdout.read(int(header[2]))
+        self._batch.stdout.read(1)  # abschließender Zeilenumbruch
+
+        entries = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            entries.append((
+                data[pos:space].decode(),
+                data[space + 1:nul].decode("utf-8", "surrogateescape"),
+                data[nul + 1:nul + 21].hex(),
+            ))
+            pos = nul + 21
+        return entries
+
+    def object_sizes(self, shas: Iterable[str]) -> dict[str, int]:
+        """Ermittelt die Größen mehrerer Objekte; fehlende Objekte werden ausgelassen."""
+        pending = list(shas)
+        sizes: dict[str, int] = {}
+
+        for start in range(0, len(pending), self.CHUNK_SIZE):
+            chunk = pending[start:start + self.CHUNK_SIZE]
+            self._batch_check.stdin.write("".join(f"{sha}\n" for sha in chunk).encode())
+            self._batch_check.stdin.flush()
+
+            for _ in chunk:
+                parts = self._batch_check.stdout.readline().split()
+                if len(parts) == 3:
+                    sizes[parts[0].decode()] = int(parts[2])
+
+        return sizes
+
+    def close(self):
+        for process in (self._batch, self._batch_check):
+            if process.stdin and not process.stdin.closed:
+                process.stdin.close()
+            process.wait()
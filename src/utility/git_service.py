@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 from git import GitCommandError, Repo
 
@@ -7,6 +8,8 @@ from model import RepositoryMetaData
 from .configuration_service import ConfigurationService
 from .file_service import FileService
 from .logging_service import LoggingService
+from .object_store_service import ObjectStoreService
+from .utils import Utils
 
 
 class GitService:
@@ -15,7 +18,7 @@ class GitService:
         raise TypeError("This utility class cannot be instantiated.")
 
     @classmethod
-    def clone_repo(cls, repo: RepositoryMetaData):
+    def clone_repo(cls, repo: RepositoryMetaData, reference: Optional[str] = None):
         if FileService.has_repository(repo):
             LoggingService.info(
                 f"📦 {repo.repository_name} ist bereits geklont – kein Klonen erforderlich."
@@ -27,7 +30,12 @@ class GitService:
                 ConfigurationService.get_repository_path_builder(repo)
             )
             LoggingService.info("⬇️ Repository nicht gefunden – beginne mit Klonen ...")
-            Repo.clone_from(repo.repository_http_url, target_path)
+            if reference:
+                # Objekte aus dem gemeinsamen Objektspeicher über alternates mitnutzen
+                LoggingService.info(f"🔗 Nutze gemeinsamen Objektspeicher: {reference}")
+                Repo.clone_from(repo.repository_http_url, target_path, reference=reference)
+            else:
+                Repo.clone_from(repo.repository_http_url, target_path)
             LoggingService.info(f"✅ Klonen von {repo.repository_name} abgeschlossen.")
         except GitCommandError as e:
             LoggingService.error(
@@ -77,11 +85,44 @@ class GitService:
         except Exception as e:
             LoggingService.error(f"⚠️ Ungültiges Repository {repo.repository_name}: {e}")
 
+    @classmethod
+    def clone_network(cls, members: list[RepositoryMetaData]) -> int:
+        """
+        Klont bzw. aktualisiert alle Mitglieder eines Fork-Netzwerks über den gemeinsamen Objektspeicher.
+
+        :return: Insgesamt übertragene Bytes (Speicher-Fetches und eigene Objekte neuer Klone).
+        """
+        network_key = ObjectStoreService.network_key(members[0])
+        LoggingService.info(f"🕸️ Fork-Netzwerk {network_key} mit {len(members)} Mitgliedern ...")
+
+        shared_transfer = 0
+        for repo in members:
+            store_path, transferred = ObjectStoreService.prepare_member(repo)
+            shared_transfer += transferred
+
+            repo_path = FileService.get_absolute_path(
+                ConfigurationService.get_repository_path_builder(repo)
+            )
+            if FileService.has_repository(repo):
+                GitService.update_repo(repo)
+            else:
+                GitService.clone_repo(repo, reference=store_path)
+                if FileService.has_repository(repo):
+                    shared_transfer += Utils.directory_size(os.path.join(repo_path, ".git", "objects"))
+
+        return shared_transfer
+
     @classmethod
     def get_all_repositories(cls, repository_list: list[RepositoryMetaData]):
         LoggingService.info(f"⏩ Starte Verarbeitung von {len(repository_list)} Repositories ...")
 
-        for repository_item in repository_list:
+        for members in ObjectStoreService.group_by_network(repository_list).values():
+            if len(members) > 1:
+                # Forks teilen sich einen Objektspeicher mit ihrem Upstream
+                GitService.clone_network(members)
+                continue
+
+            repository_item = members[0]
             repo_path = ConfigurationService.get_repository_path_builder(
                 repository_item
             )
@@ -55,6 +55,8 @@ class GithubService:
                         repository_id=repo.id,
                         repository_http_url=repo.html_url,
                         repository_size=repo.size,
+                        is_fork=repo.fork,
+                        network_root=repo.source.full_name if repo.fork and repo.source else None,
                     )
                 )
 
@@ -0,0 +1,259 @@
+import os
+import shutil
+import subprocess
+import threading
+from typing import List, Optional
+
+from git import GitCommandError, Repo
+
+from model import EnvConfig, ObjectStoreSavings, RepositoryMetaData, WorkspaceEntry
+
+from .configuration_service import ConfigurationService
+from .file_service import FileService
+from .logging_service import LoggingService
+from .utils import Utils
+
+
+class ObjectStoreService:
+    """
+    Gemeinsamer Bare-Objektspeicher pro Fork-Netzwerk.
+
+    Alle Mitglieder eines Netzwerks werden in einen Bare-Speicher gefetcht und mit
+    `--reference` geklont, sodass identische Objekte nur einmal übertragen und
+    gespeichert werden. Klone referenzieren ausschließlich den Speicher, nie einen
+    anderen Klon – das Entfernen des Upstream-Klons bricht daher keinen Fork.
+    Der Speicher selbst wird erst gelöscht, nachdem alle Mitglieder per Repack
+    eigenständig gemacht und geprüft wurden.
+    """
+
+    STORE_DIRECTORY = "object-stores"
+    COLLAPSED_SUFFIX = WorkspaceEntry.COLLAPSED_SUFFIX
+
+    _guard = threading.Lock()
+    _store_locks: dict[str, threading.Lock] = {}
+    _store_sizes: Optional[dict[str, int]] = None
+
+    def __init__(self):
+        raise TypeError("This utility class cannot be instantiated.")
+
+    @staticmethod
+    def network_key(repo: RepositoryMetaData) -> str:
+        return repo.network_root or f"{repo.repository_owner}/{repo.repository_name}"
+
+    @classmethod
+    def group_by_network(
+        cls, repositories: List[RepositoryMetaData]
+    ) -> dict[str, List[RepositoryMetaData]]:
+        groups: dict[str, List[RepositoryMetaData]] = {}
+        for repo in repositories:
+            groups.setdefault(cls.network_key(repo), []).append(repo)
+
+        # Upstream zuerst, damit Forks nur noch ihre Abweichungen übertragen
+        for members in groups.values():
+            members.sort(key=lambda repo: repo.is_fork)
+
+        LoggingService.info(
+            f"🕸️ {len(repositories)} Repositories in {len(groups)} Fork-Netzwerke gruppiert."
+        )
+        return groups
+
+    @classmethod
+    def store_path(cls, network_key: str) -> str:
+        return FileService.get_absolute_path(
+            ConfigurationService.get_data_directory(),
+            EnvConfig.organisation(),
+            cls.STORE_DIRECTORY,
+            f"{network_key.replace('/', '__')}.git",
+        )
+
+    @classmethod
+    def reference_for(cls, repo: RepositoryMetaData) -> Optional[str]:
+        path = cls.store_path(cls.network_key(repo))
+        return path if os.path.isdir(path) else None
+
+    @staticmethod
+    def ensure_store(store_path: str) -> Repo:
+        if os.path.isdir(store_path):
+            return Repo(store_path)
+
+        LoggingService.info(f"🗃️ Lege gemeinsamen Objektspeicher an: {store_path}")
+        store = Repo.init(store_path, bare=True, mkdir=True)
+        with store.config_writer() as writer:
+            # Objekte im Speicher dürfen nie verworfen werden – Klone verweisen darauf
+            writer.set_value("gc", "pruneExpire", "never")
+            writer.set_value("gc", "reflogExpireUnreachable", "never")
+            writer.set_value("fetch", "prune", "false")
+        return store
+
+    @staticmethod
+    def fetch_into_store(store_path: str, member_name: str, url: str) -> int:
+        """
+        Holt alle Branches eines Mitglieds in den Speicher.
+
+        :return: Zuwachs des Speichers in Bytes (≈ übertragene Daten).
+        """
+        before = Utils.directory_size(os.path.join(store_path, "objects"))
+        Repo(store_path).git.fetch(
+            "--no-tags", url, f"+refs/heads/*:refs/members/{member_name}/heads/*"
+        )
+        return Utils.directory_size(os.path.join(store_path, "objects")) - before
+
+    @staticmethod
+    def verify(repo_path: str) -> bool:
+        try:
+            Repo(repo_path).git.fsck("--connectivity-only")
+            return True
+        except GitCommandError as e:
+            LoggingService.error(f"❌ Integritätsprüfung fehlgeschlagen für {repo_path}: {e}")
+            return False
+
+    @classmethod
+    def dissociate(cls, repo_path: str) -> bool:
+        """Kopiert alle referenzierten Objekte in den Klon und entfernt die alternates."""
+        git_dir = os.path.join(repo_path, ".git")
+        if not os.path.isdir(git_dir):
+            git_dir = repo_path  # Bare-Repository
+        alternates = os.path.join(git_dir, "objects", "info", "alternates")
+        if not os.path.exists(alternates):
+            return cls.verify(repo_path)
+
+        try:
+            Repo(repo_path).git.repack("-a", "-d")
+        except GitCommandError as e:
+            LoggingService.error(f"❌ Repack fehlgeschlagen für {repo_path}: {e}")
+            return False
+
+        os.remove(alternates)
+        return cls.verify(repo_path)
+
+    @staticmethod
+    def reachable_object_bytes(repo_path: str) -> int:
+        """Plattenbedarf aller erreichbaren Objekte – entspricht einem eigenständigen Klon."""
+        shas = Repo(repo_path).git.rev_list("--objects", "--all").splitlines()
+        result = subprocess.run(
+            ["git", "-C", repo_path, "cat-file", "--batch-check=%(objectsize:disk)"],
+            input="\n".join(line.split(" ", 1)[0] for line in shas),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return sum(int(size) for size in result.stdout.split() if size.isdigit())
+
+    @classmethod
+    def measure_savings(
+        cls,
+        network_key: str,
+        store_path: str,
+        member_paths: List[str],
+        shared_transfer_bytes: int,
+    ) -> ObjectStoreSavings:
+        independent_disk = 0
+        independent_transfer = 0
+        shared_disk = Utils.directory_size(store_path)
+
+        for path in member_paths:
+            member_size = Utils.directory_size(path)
+            own_objects = Utils.directory_size(os.path.join(path, ".git", "objects"))
+            reachable = cls.reachable_object_bytes(path)
+
+            shared_disk += member_size
+            independent_disk += member_size - own_objects + reachable
+            independent_transfer += reachable
+
+        return ObjectStoreSavings(
+            network=network_key,
+            members=len(member_paths),
+            independent_disk_bytes=independent_disk,
+            shared_disk_bytes=shared_disk,
+            independent_transfer_bytes=independent_transfer,
+            shared_transfer_bytes=shared_transfer_bytes,
+        )
+
+    @classmethod
+    def prepare_member(cls, repo: RepositoryMetaData) -> tuple[Optional[str], int]:
+        """
+        Legt den Speicher des Netzwerks bei Bedarf an und holt das Mitglied hinein.
+
+        :return: Pfad des Speichers (None bei Fehlern) und übertragene Bytes.
+        """
+        network_key = cls.network_key(repo)
+        store_path = cls.store_path(network_key)
+
+        with cls._guard:
+            lock = cls._store_locks.setdefault(store_path, threading.Lock())
+
+        # Fetches in denselben Speicher nacheinander ausführen
+        with lock:
+            try:
+                cls.ensure_store(store_path)
+                transferred = cls.fetch_into_store(
+                    store_path, str(repo.repository_id), repo.repository_http_url
+                )
+            except GitCommandError as e:
+                LoggingService.error(f"❌ Fetch in Objektspeicher fehlgeschlagen für {repo.repository_name}: {e}")
+                return (store_path if os.path.isdir(store_path) else None), 0
+
+            size = Utils.directory_size(store_path)
+
+        with cls._guard:
+            cls._sizes()[store_path] = size
+        return store_path, transferred
+
+    @classmethod
+    def total_store_bytes(cls) -> int:
+        """Plattenbedarf aller Objektspeicher (wird nach jedem Fetch aktualisiert)."""
+        with cls._guard:
+            return sum(cls._sizes().values())
+
+    @classmethod
+    def store_bytes(cls, network_key: str) -> int:
+        """Plattenbedarf des Speichers eines Netzwerks (0, wenn keiner existiert)."""
+        with cls._guard:
+            return cls._sizes().get(cls.store_path(network_key), 0)
+
+    @classmethod
+    def _sizes(cls) -> dict[str, int]:
+        """Größen je Speicher; beim ersten Zugriff einmalig vom Datenträger ermittelt. Guard muss gehalten werden."""
+        if cls._store_sizes is None:
+            cls._store_sizes = {}
+            directory = FileService.get_absolute_path(
+                ConfigurationService.get_data_directory(), EnvConfig.organisation(), cls.STORE_DIRECTORY
+            )
+            if os.path.isdir(directory):
+                for entry in os.scandir(directory):
+                    if entry.is_dir():
+                        cls._store_sizes[entry.path] = Utils.directory_size(entry.path)
+        return cls._store_sizes
+
+    @classmethod
+    def remove_store(cls, store_path: str, member_paths: List[str]) -> bool:
+        """
+        Löscht einen Objektspeicher, nachdem alle vorhandenen Mitglieder (auch reduzierte
+        Bare-Kopien) per Repack eigenständig gemacht und mit fsck geprüft wurden.
+        """
+        if not os.path.isdir(store_path):
+            return True
+
+        for member_path in member_paths:
+            for path in (member_path, f"{member_path}{cls.COLLAPSED_SUFFIX}"):
+                if os.path.isdir(path) and not cls.dissociate(path):
+                    LoggingService.error(
+                        f"❌ {path} hängt weiterhin vom Objektspeicher ab – Löschen abgebrochen."
+                    )
+                    return False
+
+        shutil.rmtree(store_path)
+        with cls._guard:
+            cls._sizes().pop(store_path, None)
+        LoggingService.info(f"🧹 Objektspeicher {store_path} entfernt.")
+        return True
+
+    @classmethod
+    def remove_network_store(cls, network_key: str, members: List[RepositoryMetaData]) -> bool:
+        return cls.remove_store(
+            cls.store_path(network_key),
+            [
+                FileService.get_absolute_path(ConfigurationService.get_repository_path_builder(repo))
+                for repo in members
+            ],
+        )
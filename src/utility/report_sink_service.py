@@ -0,0 +1,255 @@
+import csv
+import heapq
+import json
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, Optional
+
+from .logging_service import LoggingService
+from .utils import Utils
+
+
+class ReportWriter(ABC):
+    """Basisklasse für Ausgabeformate einer `ReportSink`. Erhält Zeilen als dicts in Batches."""
+
+    def open(self):
+        """Bereitet die Ausgabe vor dem ersten Batch vor."""
+        return None
+
+    @abstractmethod
+    def write_batch(self, rows: List[dict]):
+        pass
+
+    def close(self):
+        """Schließt die Ausgabe nach vollständigem, fehlerfreiem Durchlauf ab."""
+        return None
+
+    def abort(self):
+        """Verwirft die Ausgabe nach einem Fehler."""
+        return None
+
+
+class FileReportWriter(ReportWriter):
+    """Schreibt in eine temporäre Datei, die erst nach fehlerfreiem Abschluss die Zieldatei ersetzt."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._temp_path = f"{path}.tmp"
+        self._file = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self._temp_path, "w", encoding="utf-8", newline="")
+
+    def close(self):
+        self._file.close()
+        self._file = None
+        os.replace(self._temp_path, self.path)
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+
+class CsvReportWriter(FileReportWriter):
+    def __init__(self, path: str, fieldnames: Optional[List[str]] = None):
+        """:param fieldnames: Spalten; ohne Angabe aus der ersten Zeile abgeleitet (leere Eingabe ergibt dann keine Kopfzeile)."""
+        super().__init__(path)
+        self.fieldnames = fieldnames
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write_batch(self, rows: List[dict]):
+        self._ensure_header(list(rows[0].keys()))
+        self._writer.writerows(rows)
+
+    def close(self):
+        if self.fieldnames is not None:
+            self._ensure_header(self.fieldnames)
+        super().close()
+
+    def _ensure_header(self, fieldnames: List[str]):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames or fieldnames)
+            self._writer.writeheader()
+
+
+class JsonlReportWriter(FileReportWriter):
+    def write_batch(self, rows: List[dict]):
+        self._file.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+
+class ColumnarReportWriter(FileReportWriter):
+    """
+    Spaltenorientierte Ausgabe: pro Batch eine Zeilengruppe als JSON-Zeile
+    der Form {"rows": n, "columns": {"spalte": [...]}} (Parquet-ähnlich, ohne pyarrow).
+    """
+
+    def write_batch(self, rows: List[dict]):
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+        self._file.write(json.dumps({"rows": len(rows), "columns": columns}, ensure_ascii=False) + "\n")
+
+
+class LatexReportWriter(ReportWriter):
+    """Sammelt nur (Wert, Label)-Paare und formatiert sie am Ende für LaTeX."""
+
+    def __init__(
+        self,
+        value_key: str,
+        label_key: str,
+        threshold: Optional[float] = None,
+        remainder_label: str = "Rest",
+        precision: int = 1,
+    ):
+        self.value_key = value_key
+        self.label_key = label_key
+        self.threshold = threshold
+        self.remainder_label = remainder_label
+        self.precision = precision
+        self.result: Optional[str] = None
+        self._pairs: List[tuple[float, str]] = []
+        self._remainder = 0.0
+
+    def write_batch(self, rows: List[dict]):
+        for row in rows:
+            value = row[self.value_key]
+            if self.threshold is not None and value < self.threshold:
+                self._remainder += value
+            else:
+                self._pairs.append((value, row[self.label_key]))
+
+    def close(self):
+        if self._remainder > 0:
+            self._pairs.append((self._remainder, self.remainder_label))
+        self.result = Utils.format_latex_pairs(self._pairs, self.precision)
+
+
+class SummaryReportWriter(ReportWriter):
+    """Gibt statt aller Zeilen nur die Top-N (bzw. die ersten N) auf der Konsole aus."""
+
+    def __init__(self, title: str, top_n: int = 10, value_key: Optional[str] = None):
+        self.title = title
+        self.top_n = top_n
+        self.value_key = value_key
+        self._rows: List[Any] = []
+        self._count = 0
+
+    def write_batch(self, rows: List[dict]):
+        for row in rows:
+            if self.value_key is None:
+                if len(self._rows) < self.top_n:
+                    self._rows.append(row)
+            else:
+                item = (row[self.value_key], self._count, row)
+                if len(self._rows) < self.top_n:
+                    heapq.heappush(self._rows, item)
+                else:
+                    heapq.heappushpop(self._rows, item)
+            self._count += 1
+
+    def close(self):
+        rows = self._rows if self.value_key is None else [
+            row for _, _, row in sorted(self._rows, key=lambda t: (-t[0], t[1]))
+        ]
+        LoggingService.info(f"📈 {self.title} (Top {len(rows)} von {self._count}):")
+        for row in rows:
+            LoggingService.info(f"   {row}")
+
+
+class ReportSink:
+    """
+    Verteilt einen Ergebnis-Iterator in einem Durchlauf auf mehrere Writer.
+
+    Die Zeilen werden einmalig per `to_dict()` umgewandelt, in Batches gepuffert
+    und über begrenzte Queues an je einen Hintergrund-Thread pro Writer übergeben.
+    """
+
+    _STOP = object()
+    _ABORT = object()
+
+    def __init__(self, writers: List[ReportWriter], batch_size: int = 1000, queue_size: int = 8):
+        self.writers = writers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+
+    def consume(self, rows: Iterable[Any]) -> int:
+        """
+        :param rows: Ergebnisobjekte mit `to_dict()` oder bereits dicts.
+        :return: Anzahl geschriebener Zeilen.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.writers]
+        errors: List[Exception] = []
+        threads = [
+            threading.Thread(target=self._run_writer, args=(writer, q, errors), daemon=True)
+            for writer, q in zip(self.writers, queues, strict=True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        count = 0
+        batch: List[dict] = []
+        completed = False
+        try:
+            for row in rows:
+                batch.append(row.to_dict() if hasattr(row, "to_dict") else row)
+                if len(batch) >= self.batch_size:
+                    self._publish(queues, batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                self._publish(queues, batch)
+                count += len(batch)
+            completed = True
+        finally:
+            # Bricht der Produzent ab, verwerfen alle Writer ihre Ausgabe
+            for q in queues:
+                q.put(self._STOP if completed else self._ABORT)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+        return count
+
+    @staticmethod
+    def _publish(queues: List[queue.Queue], batch: List[dict]):
+        # Batches werden nur gelesen – alle Writer teilen sich dieselbe Liste
+        for q in queues:
+            q.put(batch)
+
+    @classmethod
+    def _run_writer(cls, writer: ReportWriter, q: queue.Queue, errors: List[Exception]):
+        failed = False
+        try:
+            writer.open()
+        except Exception as e:
+            failed = True
+            errors.append(e)
+            LoggingService.error(f"❌ Writer {type(writer).__name__} konnte nicht geöffnet werden: {e}")
+
+        while True:
+            batch = q.get()
+            if batch is cls._STOP or batch is cls._ABORT:
+                failed = failed or batch is cls._ABORT
+                break
+            if failed:
+                continue  # Queue weiter leeren, damit der Produzent nicht blockiert
+            try:
+                writer.write_batch(batch)
+            except Exception as e:
+                failed = True
+                errors.append(e)
+                LoggingService.error(f"❌ Fehler in Writer {type(writer).__name__}: {e}")
+
+        try:
+            if failed:
+                writer.abort()
+            else:
+                writer.close()
+        except Exception as e:
+            errors.append(e)
+            LoggingService.error(f"❌ Writer {type(writer).__name__} konnte nicht geschlossen werden: {e}")
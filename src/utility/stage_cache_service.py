@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from model import EnvConfig
+
+from .configuration_service import ConfigurationService
+from .file_service import FileService
+from .logging_service import LoggingService
+
+T = TypeVar("T")
+
+
+class StageCacheService:
+    """
+    Speichert Ergebnisse von Auswertungsschritten unter einem Fingerabdruck ihrer Eingaben.
+
+    Der Schlüssel umfasst den Namen des Schritts, die übergebenen Eingaben (z. B.
+    Inhalts-Hash der Metadaten, Konfiguration, Präzision) und die Code-Version.
+    Ändert sich nichts davon, wird das gespeicherte Ergebnis wiederverwendet.
+    """
+
+    CACHE_DIRECTORY = ".stage-cache"
+    OUTPUT_INDEX = "outputs.json"
+    MAX_ENTRIES = 64
+
+    _code_version: Optional[str] = None
+
+    def __init__(self):
+        raise TypeError("This utility class cannot be instantiated.")
+
+    @staticmethod
+    def file_fingerprint(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def canonical_fingerprint(cls, value: Any) -> str:
+        canonical = json.dumps(cls._canonical(value), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @classmethod
+    def code_version(cls) -> str:
+        """Hash über alle Quelltextdateien – jede Code-Änderung verwirft den Cache."""
+        if cls._code_version is None:
+            source_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(source_root):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                for name in sorted(files):
+                    if name.endswith(".py"):
+                        path = os.path.join(root, name)
+                        digest.update(os.path.relpath(path, source_root).encode())
+                        digest.update(cls.file_fingerprint(path).encode())
+            cls._code_version = digest.hexdigest()
+        return cls._code_version
+
+    @classmethod
+    def run_stage(cls, stage: str, inputs: dict[str, Any], compute_fn: Callable[[], T]) -> tuple[T, str]:
+        """
+        Führt einen Auswertungsschritt aus oder lädt dessen zwischengespeichertes Ergebnis.
+
+        :param stage: Name des Schritts.
+        :param inputs: Alle Eingaben, von denen das Ergebnis abhängt.
+        :param compute_fn: Berechnet das Ergebnis bei einem Cache-Miss.
+        :return: Ergebnis und Schlüssel des Schritts (für `is_output_current`/`mark_output`).
+        """
+        key = cls.canonical_fingerprint({"stage": stage, "inputs": inputs, "code": cls.code_version()})
+        cache_path = os.path.join(cls._cache_directory(), f"{stage}-{key}.pickle")
+
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    result = pickle.load(f)
+                os.utime(cache_path)
+                LoggingService.info(f"♻️ Schritt '{stage}' aus dem Cache geladen.")
+                return result, key
+            except (OSError, pickle.UnpicklingError, EOFError) as e:
+                LoggingService.error(f"⚠️ Cache-Eintrag für '{stage}' unlesbar, berechne neu: {e}")
+
+        result = compute_fn()
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(temp_path, cache_path)
+        cls._evict()
+
+        return result, key
+
+    @classmethod
+    def is_output_current(cls, path: str, key: str) -> bool:
+        """Prüft, ob eine Ausgabedatei existiert und zuletzt für denselben Schlüssel geschrieben wurde."""
+        return os.path.exists(path) and cls._load_output_index().get(os.path.abspath(path)) == key
+
+    @classmethod
+    def mark_output(cls, path: str, key: str):
+        """Hinterlegt im Cache-Verzeichnis den Schlüssel des Schritts, aus dem eine Ausgabedatei erzeugt wurde."""
+        index = cls._load_output_index()
+        index[os.path.abspath(path)] = key
+
+        index_path = os.path.join(cls._cache_directory(), cls.OUTPUT_INDEX)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(temp_path, index_path)
+
+    @classmethod
+    def _load_output_index(cls) -> dict[str, str]:
+        index_path = os.path.join(cls._cache_directory(), cls.OUTPUT_INDEX)
+        if not os.path.exists(index_path):
+            return {}
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @classmethod
+    def _cache_directory(cls) -> str:
+        return FileService.get_absolute_path(
+            ConfigurationService.get_data_directory(), EnvConfig.organisation(), cls.CACHE_DIRECTORY
+        )
+
+    @classmethod
+    def _evict(cls):
+        """Entfernt die am längsten nicht genutzten Einträge oberhalb von MAX_ENTRIES."""
+        directory = cls._cache_directory()
+        entries = sorted(
+            (entry for entry in os.scandir(directory) if entry.name.endswith(".pickle")),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in entries[cls.MAX_ENTRIES:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+
+    @classmethod
+    def _canonical(cls, value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return cls._canonical(asdict(value))
+        if isinstance(value, dict):
+            return {str(k): cls._canonical(v) for k, v in value.items()}
+        if isinstance(value, (set, frozenset)):
+            return sorted(cls._canonical(v) for v in value)
+        if isinstance(value, (list, tuple)):
+            return [cls._canonical(v) for v in value]
+        return value
@@ -1,3 +1,4 @@
+import os
 from typing import Callable, List, TypeVar
 
 T = TypeVar("T")
@@ -5,6 +6,20 @@ T = TypeVar("T")
 
 class Utils:
 
+    @staticmethod
+    def directory_size(path: str) -> int:
+        """
+        Summiert die Dateigrößen (in Bytes) unterhalb eines Verzeichnisses.
+        """
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    continue
+        return total
+
     @staticmethod
     def _extract_pairs(
         data: List[T],
@@ -31,6 +46,17 @@ class Utils:
             above.append((remainder_sum, remainder_label))
         return above
 
+    @staticmethod
+    def format_latex_pairs(
+        pairs: List[tuple[float, str]],
+        precision: int = 1
+    ) -> str:
+        """
+        Formatiert (Wert, Label)-Tupel im Format 'Wert/Label', absteigend nach Wert sortiert.
+        """
+        sorted_pairs = sorted(pairs, key=lambda t: t[0], reverse=True)
+        return ",".join(f"{value:.{precision}f}/{label}" for value, label in sorted_pairs)
+
     @staticmethod
     def format_latex_distribution(
         data: List[T],
@@ -44,9 +70,7 @@ class Utils:
         """
         try:
             pairs = Utils._extract_pairs(data, value_fn, label_fn)
-            sorted_pairs = sorted(pairs, key=lambda t: t[0], reverse=True)
-            lines = [f"{value:.{precision}f}/{label}" for value, label in sorted_pairs]
-            return ",".join(lines)
+            return Utils.format_latex_pairs(pairs, precision)
         except Exception as err:
             raise ValueError("Fehler bei der LaTeX-Formatierung") from err
 
@@ -73,8 +97,6 @@ class Utils:
         try:
             pairs = Utils._extract_pairs(data, value_fn, label_fn)
             grouped_pairs = Utils._apply_grouped_remainder(pairs, threshold, remainder_label)
-            sorted_pairs = sorted(grouped_pairs, key=lambda t: t[0], reverse=True)
-            lines = [f"{value:.{precision}f}/{label}" for value, label in sorted_pairs]
-            return ",".join(lines)
+            return Utils.format_latex_pairs(grouped_pairs, precision)
         except Exception as err:
             raise ValueError("Fehler bei der LaTeX-Formatierung mit Gruppierung") from err
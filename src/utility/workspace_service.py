@@ -0,0 +1,449 @@
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, Optional
+
+from git import GitCommandError, Repo
+from tqdm import tqdm
+
+from model import EnvConfig, RepositoryMetaData, WorkspaceConfig, WorkspaceEntry
+
+from .configuration_service import ConfigurationService
+from .file_service import FileService
+from .git_service import GitService
+from .logging_service import LoggingService
+from .object_store_service import ObjectStoreService
+from .utils import Utils
+
+
+class WorkspaceService:
+    """
+    Verwaltet die geklonten Repositories als Arbeitsbereich mit festem Speicherbudget.
+
+    Vor dem Klonen wird anhand von `repository_size` Platz reserviert. Reicht das
+    Budget nicht, werden die am längsten nicht mehr analysierten Klone entfernt
+    bzw. (bei `collapse_on_evict`) auf ein Bare-Repository ohne Arbeitskopie reduziert.
+    Erst wenn kein Klon mehr verdrängbar ist, wird der Objektspeicher eines
+    Fork-Netzwerks ohne aktive Klone aufgelöst (Mitglieder vorher eigenständig gemacht).
+    """
+
+    INDEX_FILE = "workspace-index.json"
+    COLLAPSED_SUFFIX = WorkspaceEntry.COLLAPSED_SUFFIX
+
+    _config: WorkspaceConfig = WorkspaceConfig()
+    _entries: dict[str, WorkspaceEntry] = {}
+    _pinned: set[str] = set()
+    _evicting: set[str] = set()
+    _restoring: set[str] = set()
+    _admitting: set[str] = set()
+    _networks: dict[str, List[RepositoryMetaData]] = {}
+    _evicting_stores: set[str] = set()
+    _reserved_bytes: int = 0
+    _loaded: bool = False
+    _condition = threading.Condition(threading.RLock())
+
+    def __init__(self):
+        raise TypeError("This utility class cannot be instantiated.")
+
+    @classmethod
+    def configure(cls, config: WorkspaceConfig):
+        ObjectStoreService.total_store_bytes()  # Speichergrößen einmalig außerhalb des Locks ermitteln
+        with cls._condition:
+            cls._config = config
+            cls._load_index()
+            LoggingService.info(
+                f"🗄️ Arbeitsbereich: Budget {config.budget_bytes} Bytes, belegt {cls.used_bytes()} Bytes"
+            )
+
+    @staticmethod
+    def repository_key(repo: RepositoryMetaData) -> str:
+        return f"{repo.repository_owner}/{repo.repository_name}"
+
+    @classmethod
+    def estimate_size(cls, repo: RepositoryMetaData) -> int:
+        # repository_size liefert GitHub in kB (nur Objektdatenbank)
+        return int(repo.repository_size * 1024 * cls._config.size_factor)
+
+    @classmethod
+    def used_bytes(cls) -> int:
+        """
+        Belegter Platz der Klone inklusive der gemeinsamen Objektspeicher (alternates).
+
+        Speicher von Netzwerken außerhalb des aktuellen `process_rolling`-Laufs
+        zählen mit, werden aber nicht verdrängt.
+        """
+        with cls._condition:
+            return sum(entry.size_bytes for entry in cls._entries.values()) + ObjectStoreService.total_store_bytes()
+
+    @classmethod
+    def acquire(cls, repo: RepositoryMetaData) -> Optional[str]:
+        """
+        Stellt sicher, dass das Repository ausgecheckt ist, und sperrt es gegen Verdrängung.
+
+        Git- und Dateisystemoperationen laufen außerhalb des Locks.
+
+        :return: Absoluter Pfad des Klons oder None, falls das Klonen fehlgeschlagen ist.
+        """
+        key = cls.repository_key(repo)
+        network = ObjectStoreService.network_key(repo)
+        path = FileService.get_absolute_path(
+            ConfigurationService.get_repository_path_builder(repo)
+        )
+
+        required = 0
+        while True:
+            with cls._condition:
+                cls._load_index()
+                while key in cls._evicting:
+                    cls._condition.wait()
+                entry = cls._entries.get(key)
+                if entry is not None and not entry.collapsed:
+                    cls._pinned.add(key)
+                    break
+                if entry is not None:
+                    # Die eigene Bare-Kopie darf während der Zulassung nicht verdrängt werden
+                    cls._restoring.add(key)
+
+            if entry is None and FileService.has_repository(repo):
+                # Vorhandener, noch nicht erfasster Klon
+                size = Utils.directory_size(path)
+                with cls._condition:
+                    cls._register(key, path, size)
+                continue
+
+            required = cls.estimate_size(repo)
+            if entry is not None:
+                # Die Bare-Kopie ist bereits im Budget enthalten und wird beim Wiederherstellen ersetzt
+                required = max(0, required - entry.size_bytes)
+            cls._admit(key, network, required)
+            break
+
+        size = None
+        try:
+            if entry is not None and entry.collapsed:
+                cls._restore(repo, entry)
+            elif FileService.has_repository(repo):
+                GitService.update_repo(repo)
+            else:
+                GitService.clone_repo(repo, reference=cls._reference_for(repo))
+        finally:
+            if FileService.has_repository(repo):
+                size = Utils.directory_size(path)
+
+            with cls._condition:
+                cls._reserved_bytes -= required
+                cls._restoring.discard(key)
+                if size is not None:
+                    cls._register(key, path, size)
+                    cls._save_index()
+                else:
+                    cls._pinned.discard(key)
+                cls._condition.notify_all()
+
+        return path if size is not None else None
+
+    @classmethod
+    def release(cls, repo: RepositoryMetaData):
+        """Gibt ein analysiertes Repository frei und hält das Budget ein."""
+        key = cls.repository_key(repo)
+
+        with cls._condition:
+            cls._pinned.discard(key)
+            entry = cls._entries.get(key)
+            if entry is not None:
+                entry.last_access = time.time()
+            cls._save_index()
+            cls._condition.notify_all()
+
+        while True:
+            with cls._condition:
+                over_budget = cls.used_bytes() > cls._config.budget_bytes
+            if not over_budget or not cls._evict_one():
+                break
+
+    @classmethod
+    def process_rolling(
+        cls,
+        repositories: List[RepositoryMetaData],
+        analyze_fn: Callable[[RepositoryMetaData, str], Any],
+    ) -> List[Any]:
+        """
+        Klont, analysiert und verdrängt Repositories als Pipeline.
+
+        Die Klon-Threads blockieren, solange das Budget erschöpft ist. Sobald eine
+        Analyse abgeschlossen ist, wird ihr Klon freigegeben und kann verdrängt werden.
+
+        :param repositories: Zu verarbeitende Repositories.
+        :param analyze_fn: Analysefunktion, erhält Metadaten und lokalen Pfad.
+        :return: Liste der Analyseergebnisse (None bei Fehlern).
+        """
+        LoggingService.info(
+            f"⏩ Starte rollierende Verarbeitung von {len(repositories)} Repositories ..."
+        )
+        results: List[Any] = [None] * len(repositories)
+        # Netzwerke zusammenhängend und Upstream zuerst klonen, damit Forks den Speicher mitnutzen
+        networks = ObjectStoreService.group_by_network(repositories)
+        with cls._condition:
+            cls._networks = {key: members for key, members in networks.items() if len(members) > 1}
+        positions = {id(repo): i for i, repo in enumerate(repositories)}
+        ordered = [positions[id(repo)] for members in networks.values() for repo in members]
+
+        def analyze(repo: RepositoryMetaData, path: str) -> Any:
+            try:
+                return analyze_fn(repo, path)
+            finally:
+                cls.release(repo)
+
+        with (
+            ThreadPoolExecutor(max_workers=cls._config.clone_threads) as clone_executor,
+            ThreadPoolExecutor(max_workers=cls._config.analyze_threads) as analyze_executor,
+        ):
+            clone_futures = {
+                clone_executor.submit(cls.acquire, repositories[i]): i
+                for i in ordered
+            }
+
+            analyze_futures = {}
+            for future in as_completed(clone_futures):
+                i = clone_futures[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    LoggingService.error(f"❌ Bereitstellung fehlgeschlagen für {repositories[i].repository_name}: {e}")
+                    continue
+                if path is None:
+                    continue
+                analyze_futures[analyze_executor.submit(analyze, repositories[i], path)] = i
+
+            for future in tqdm(as_completed(analyze_futures), total=len(analyze_futures), desc="🔬 Analyse"):
+                i = analyze_futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    LoggingService.error(f"❌ Analyse fehlgeschlagen für {repositories[i].repository_name}: {e}")
+
+        LoggingService.info(
+            f"🏁 Verarbeitung abgeschlossen. Belegt: {cls.used_bytes()} / {cls._config.budget_bytes} Bytes"
+        )
+        return results
+
+    @classmethod
+    def _admit(cls, key: str, network: str, required: int):
+        """Wartet (bzw. verdrängt), bis `required` Bytes ins Budget passen, und reserviert sie."""
+        while True:
+            with cls._condition:
+                if key in cls._evicting or network in cls._evicting_stores:
+                    cls._condition.wait()
+                    continue
+                cls._admitting.add(key)
+
+                fits = cls.used_bytes() + cls._reserved_bytes + required <= cls._config.budget_bytes
+                can_evict = cls._select_victim() is not None or cls._select_store_victim() is not None
+                idle = cls._reserved_bytes == 0 and not cls._pinned and not cls._evicting
+                if not fits and not can_evict and idle:
+                    # Nichts mehr verdrängbar und kein anderer Klon in Arbeit: übergroßes Repo trotzdem zulassen
+                    LoggingService.info("⚠️ Budget reicht nicht aus – Repository wird dennoch zugelassen.")
+                    fits = True
+
+                if fits:
+                    cls._admitting.discard(key)
+                    cls._pinned.add(key)
+                    cls._reserved_bytes += required
+                    return
+
+                if not can_evict:
+                    cls._condition.wait()
+                    continue
+
+            cls._evict_one()
+
+    @classmethod
+    def _select_victim(cls) -> Optional[tuple[WorkspaceEntry, bool]]:
+        """Wählt den am längsten ungenutzten Klon und ob er reduziert statt entfernt wird. Lock muss gehalten werden."""
+        candidates = sorted(
+            (
+                entry for key, entry in cls._entries.items()
+                if key not in cls._pinned and key not in cls._evicting and key not in cls._restoring
+            ),
+            key=lambda entry: entry.last_access,
+        )
+        if not candidates:
+            return None
+
+        if cls._config.collapse_on_evict:
+            expanded = [entry for entry in candidates if not entry.collapsed]
+            if expanded:
+                return expanded[0], True
+
+        return candidates[0], False
+
+    @classmethod
+    def _select_store_victim(cls) -> Optional[str]:
+        """Wählt das am längsten ungenutzte Netzwerk, dessen Speicher von keinem aktiven Klon gebraucht wird. Lock muss gehalten werden."""
+        busy = cls._pinned | cls._restoring | cls._admitting | cls._evicting
+        candidates = []
+        for network, members in cls._networks.items():
+            keys = {cls.repository_key(repo) for repo in members}
+            if keys & busy or network in cls._evicting_stores or not ObjectStoreService.store_bytes(network):
+                continue
+            last_access = max((cls._entries[key].last_access for key in keys if key in cls._entries), default=0.0)
+            candidates.append((last_access, network))
+
+        return min(candidates)[1] if candidates else None
+
+    @classmethod
+    def _evict_one(cls) -> bool:
+        """Verdrängt einen Klon bzw. einen Objektspeicher; nur die Auswahl geschieht unter dem Lock."""
+        with cls._condition:
+            victim = cls._select_victim()
+            network = cls._select_store_victim() if victim is None else None
+            if victim is None and network is None:
+                return False
+            if victim is None:
+                keys = {cls.repository_key(repo) for repo in cls._networks[network]} & cls._entries.keys()
+                cls._evicting.update(keys)
+                cls._evicting_stores.add(network)
+            else:
+                entry, collapse = victim
+                cls._evicting.add(entry.repository_key)
+
+        if victim is None:
+            cls._evict_store(network, keys)
+            return True
+
+        size = None
+        try:
+            if collapse:
+                size = cls._collapse(entry)
+            else:
+                cls._remove(entry)
+        finally:
+            with cls._condition:
+                if size is None:
+                    cls._entries.pop(entry.repository_key, None)
+                else:
+                    entry.collapsed = True
+                    entry.size_bytes = size
+                cls._evicting.discard(entry.repository_key)
+                cls._save_index()
+                cls._condition.notify_all()
+
+        return True
+
+    @classmethod
+    def _evict_store(cls, network: str, keys: set[str]):
+        """Macht die Klone des Netzwerks per Repack eigenständig und löscht dann dessen Objektspeicher."""
+        LoggingService.info(f"🗃️ Löse Objektspeicher von {network} auf ...")
+        removed = False
+        sizes: dict[str, int] = {}
+        try:
+            removed = ObjectStoreService.remove_network_store(network, cls._networks[network])
+            for key in keys:
+                # Nach dem Repack enthalten die Klone alle Objekte selbst
+                entry = cls._entries[key]
+                sizes[key] = Utils.directory_size(
+                    f"{entry.path}{cls.COLLAPSED_SUFFIX}" if entry.collapsed else entry.path
+                )
+        finally:
+            with cls._condition:
+                if not removed:
+                    # Speicher, der sich nicht lösen lässt, nicht erneut auswählen
+                    cls._networks.pop(network, None)
+                for key, size in sizes.items():
+                    cls._entries[key].size_bytes = size
+                cls._evicting.difference_update(keys)
+                cls._evicting_stores.discard(network)
+                cls._save_index()
+                cls._condition.notify_all()
+
+    @classmethod
+    def _collapse(cls, entry: WorkspaceEntry) -> Optional[int]:
+        """:return: Größe des Bare-Repositorys oder None, wenn der Klon stattdessen entfernt wurde."""
+        bare_path = f"{entry.path}{cls.COLLAPSED_SUFFIX}"
+        LoggingService.info(f"🗜️ Reduziere {entry.repository_key} auf Bare-Repository ...")
+        try:
+            # Ohne --depth: die vollständige Historie bleibt erhalten (Objekte werden lokal verlinkt)
+            Repo.clone_from(entry.path, bare_path, bare=True)
+            shutil.rmtree(entry.path)
+        except GitCommandError as e:
+            LoggingService.error(f"❌ Reduzieren fehlgeschlagen für {entry.repository_key}: {e}")
+            shutil.rmtree(bare_path, ignore_errors=True)
+            cls._remove(entry)
+            return None
+
+        return Utils.directory_size(bare_path)
+
+    @classmethod
+    def _remove(cls, entry: WorkspaceEntry):
+        LoggingService.info(f"🧹 Entferne {entry.repository_key} aus dem Arbeitsbereich ...")
+        shutil.rmtree(entry.path, ignore_errors=True)
+        shutil.rmtree(f"{entry.path}{cls.COLLAPSED_SUFFIX}", ignore_errors=True)
+
+    @classmethod
+    def _restore(cls, repo: RepositoryMetaData, entry: WorkspaceEntry):
+        bare_path = f"{entry.path}{cls.COLLAPSED_SUFFIX}"
+        LoggingService.info(f"📤 Stelle {repo.repository_name} aus reduziertem Repository wieder her ...")
+        try:
+            repository = Repo.clone_from(bare_path, entry.path)
+            repository.remotes.origin.set_url(repo.repository_http_url)
+            shutil.rmtree(bare_path, ignore_errors=True)
+            GitService.update_repo(repo)
+        except GitCommandError as e:
+            LoggingService.error(f"❌ Wiederherstellen fehlgeschlagen für {repo.repository_name}: {e}")
+            shutil.rmtree(entry.path, ignore_errors=True)
+            shutil.rmtree(bare_path, ignore_errors=True)
+            with cls._condition:
+                cls._entries.pop(entry.repository_key, None)
+            GitService.clone_repo(repo, reference=cls._reference_for(repo))
+
+    @classmethod
+    def _reference_for(cls, repo: RepositoryMetaData) -> Optional[str]:
+        """Forks mehrerer Mitglieder laufen über den gemeinsamen Objektspeicher ihres Netzwerks."""
+        if ObjectStoreService.network_key(repo) in cls._networks:
+            store_path, _ = ObjectStoreService.prepare_member(repo)
+            return store_path
+        return ObjectStoreService.reference_for(repo)
+
+    @classmethod
+    def _register(cls, key: str, path: str, size_bytes: int) -> WorkspaceEntry:
+        """Erfasst einen ausgecheckten Klon. Lock muss gehalten werden."""
+        entry = cls._entries.get(key)
+        if entry is None:
+            entry = WorkspaceEntry(repository_key=key, path=path, size_bytes=0, last_access=time.time())
+            cls._entries[key] = entry
+        entry.size_bytes = size_bytes
+        entry.collapsed = False
+        return entry
+
+    @classmethod
+    def _index_path(cls) -> str:
+        return FileService.get_absolute_path(
+            ConfigurationService.get_data_directory(), EnvConfig.organisation(), cls.INDEX_FILE
+        )
+
+    @classmethod
+    def _load_index(cls):
+        if cls._loaded:
+            return
+        cls._loaded = True
+
+        index_path = cls._index_path()
+        if not os.path.exists(index_path):
+            return
+
+        with open(index_path, encoding="utf-8") as f:
+            for item in json.load(f):
+                entry = WorkspaceEntry(**item)
+                existing = f"{entry.path}{cls.COLLAPSED_SUFFIX}" if entry.collapsed else entry.path
+                if os.path.exists(existing):
+                    cls._entries[entry.repository_key] = entry
+
+    @classmethod
+    def _save_index(cls):
+        index_path = cls._index_path()
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump([entry.to_dict() for entry in cls._entries.values()], f, indent=2)